@@ -1,15 +1,127 @@
 """A better ANY helper for Python testing"""
 
+import functools
+import importlib
+import operator
+import sys
 import types
 import typing
 
-from annotated_types import Ge, Gt, Le, Len, Lt, MultipleOf, Predicate
-
 __version__ = "0.1.0"
 
 T = typing.TypeVar("T")
 
 
+_Check = typing.Callable[[typing.Any], typing.Any]
+_Matcher = typing.Callable[[typing.Any], "_Failure | None"]
+
+
+class _Failure(typing.NamedTuple):
+    """
+    A failed comparison, as returned by the matchers.
+
+    The human-readable reason is only formatted by ==, so match_many() checks
+    values without formatting a reason for each failure.
+    """
+
+    position: int | None  # Of the failed validator, None for a type mismatch
+    value: typing.Any
+    error: Exception | None  # Exception raised by the validator, if any
+
+
+class _Spec(typing.NamedTuple):
+    """
+    Parsed form of an AnyValue type constraint and its validators.
+
+    Built on the first comparison of each matcher.
+    """
+
+    types: tuple[type, ...]
+    exact_types: frozenset[type]
+    allow_none: bool
+    checks: tuple[tuple[_Check, int], ...]  # (check, validator position) pairs
+    cache_results: bool
+
+
+# Types of values whose comparison results can be cached by identity
+_CACHEABLE_TYPES = frozenset({bool, bytes, complex, float, int, str})
+_RESULT_CACHE_SIZE = 64
+
+# JIT-compiled and memoized predicates are shared between matchers, for the most
+# recently used predicates only
+_SHARED_PREDICATES_SIZE = 128
+
+# annotated-types constraints understood by AnyValue
+_CONSTRAINTS = ("Ge", "Le", "Gt", "Lt", "Len", "MultipleOf", "Predicate")
+
+# Constraints inlined in generated matchers: (attribute, expression) by name
+_INLINE_CONSTRAINTS: dict[str, tuple[str, str]] = {
+    "Ge": ("ge", "other >= {}"),
+    "Le": ("le", "other <= {}"),
+    "Gt": ("gt", "other > {}"),
+    "Lt": ("lt", "other < {}"),
+    "MultipleOf": ("multiple_of", "other % {} == 0"),
+}
+
+# Comparison constraints checked without compiling them: (attribute, operator)
+_COMPARISONS: dict[
+    str | None, tuple[str, typing.Callable[[typing.Any, typing.Any], typing.Any]]
+] = {
+    "Ge": ("ge", operator.ge),
+    "Le": ("le", operator.le),
+    "Gt": ("gt", operator.gt),
+    "Lt": ("lt", operator.lt),
+}
+
+# Constraint names by annotated-types class, filled once annotated_types is loaded
+_CONSTRAINT_CLASSES: dict[type, str] = {}
+
+
+def _constraint(validator: typing.Any) -> str | None:
+    """
+    Return the name of the annotated-types constraint a validator is, if any.
+
+    annotated_types isn't imported by anyvalue, which keeps it out of the import
+    time of test suites that don't use it. If the module isn't loaded, nobody
+    could have built one of its constraints, so there is nothing to check against.
+
+    Args:
+        validator: The validator to inspect
+
+    Returns:
+        The constraint class name (e.g. "Ge"), or None for any other validator
+    """
+    classes = _CONSTRAINT_CLASSES
+    if not classes:
+        annotated_types = sys.modules.get("annotated_types")
+        if annotated_types is None:
+            return None
+        classes.update({getattr(annotated_types, name): name for name in _CONSTRAINTS})
+    cls = type(validator)
+    name = classes.get(cls)
+    if name is not None:
+        return name
+    # Walking the MRO is nominal isinstance() without going through the protocol
+    # machinery Len inherits from GroupedMetadata, which is slow for anything else
+    for cls in cls.__mro__:
+        name = classes.get(cls)
+        if name is not None:
+            return name
+    return None
+
+
+# Validator lists longer than this use the generic loop instead of generated code,
+# which bounds the number of distinct generated factories
+_MAX_GENERATED_CHECKS = 4
+
+# Generating a matcher costs about as much as 20 generic comparisons, so only
+# matchers compared this many times get one
+_GENERATE_AFTER = 16
+
+# Generated matcher factories, keyed by their source code
+_MATCHER_FACTORIES: dict[str, typing.Callable[..., _Matcher]] = {}
+
+
 class AnyValue(typing.Generic[T]):
     """
     A matcher that accepts values matching specific type and validation constraints.
@@ -29,7 +141,28 @@ class AnyValue(typing.Generic[T]):
         *validators: Optional annotated-types validators (Ge, Le, Len, etc.)
     """
 
-    def __init__(self, type_constraint: T, *validators: typing.Any) -> None:
+    __slots__ = (
+        "__weakref__",
+        "_comparisons",
+        "_hash",
+        "_jit",
+        "_last_failure_reason",
+        "_match",
+        "_memoize_predicates",
+        "_repr",
+        "_results",
+        "_spec",
+        "_type_constraint",
+        "_validators",
+    )
+
+    def __init__(
+        self,
+        type_constraint: T,
+        *validators: typing.Any,
+        jit: bool = False,
+        memoize_predicates: bool = False,
+    ) -> None:
         """
         Initialize the AnyValue matcher.
 
@@ -39,16 +172,130 @@ class AnyValue(typing.Generic[T]):
                 - A union of types using | (e.g., int | float, str | None)
                 - None to match None values
             *validators: annotated-types validators to apply (Ge, Le, Len, etc.)
+            jit: JIT-compile Predicate and callable validators with Numba.
+                Requires numba to be installed. Predicates Numba can't compile
+                fall back to the plain function.
+            memoize_predicates: Cache the results of Predicate and callable
+                validators by argument value, and the result of comparisons
+                with the same immutable value. Only suitable for pure functions.
         """
-        self.type_constraint = type_constraint
-        self.validators = validators
+        self._type_constraint = type_constraint
+        self._validators = validators
+        self._jit = jit
+        self._memoize_predicates = memoize_predicates
+        # Looked up on first use, see _get_spec()
+        self._spec: _Spec | None = None
+        self._hash: int | None = None
+        # Generic comparisons so far, see _interpret() and _generate()
+        self._comparisons = 0
+        self._match: _Matcher | None = None
         self._last_failure_reason: str | None = None
+        self._repr: str | None = None
+        # Only created for matchers caching their results, see __eq__()
+        self._results: dict[int, tuple[typing.Any, str | None]] | None = None
 
-        # Parse the type constraint to extract accepted types
-        self._accepted_types = self._parse_type_constraint(type_constraint)
+        if jit:
+            # Fail right away if numba isn't installed
+            self._get_spec()
+
+    @property
+    def type_constraint(self) -> T:
+        """The type(s) accepted by this matcher."""
+        return self._type_constraint
+
+    @property
+    def validators(self) -> tuple[typing.Any, ...]:
+        """The validators applied to values of an accepted type."""
+        return self._validators
+
+    def _get_spec(self) -> _Spec:
+        """
+        Return the parsed spec of the matcher, building it on first use.
+
+        Construction only stores the arguments, so a matcher that is never
+        compared doesn't pay for parsing them.
+
+        Returns:
+            The parsed spec
+        """
+        spec = self._spec
+        if spec is None:
+            spec = self._spec = self._build_spec(
+                self._type_constraint,
+                self._validators,
+                self._jit,
+                self._memoize_predicates,
+            )
+        return spec
+
+    @classmethod
+    def _build_spec(
+        cls,
+        type_constraint: typing.Any,
+        validators: tuple[typing.Any, ...],
+        jit: bool,
+        memoize_predicates: bool,
+    ) -> _Spec:
+        """
+        Parse the matcher arguments into a spec.
 
+        Args:
+            type_constraint: The type constraint to parse
+            validators: The validators to apply
+            jit: Whether to JIT-compile predicates and callables with Numba
+            memoize_predicates: Whether to cache predicate and callable results
+
+        Returns:
+            The parsed spec
+        """
+        accepted_types = cls._parse_type_constraint(type_constraint)
+        classes = tuple(t for t in accepted_types if t is not None)
+        allow_none = None in accepted_types
+        checks_list: list[tuple[_Check, int]] = []
+        has_functions = False
+        for index, validator in enumerate(validators):
+            constraint = _constraint(validator)
+            check = cls._compile_validator(validator, constraint)
+            if check is None:
+                continue
+            if constraint in (None, "Predicate"):
+                has_functions = True
+                if jit:
+                    check = cls._share(cls._jit_compile, check)
+                if memoize_predicates:
+                    check = cls._share(cls._memoize, check)
+            checks_list.append((check, index))
+        checks = tuple(checks_list)
+        return _Spec(
+            types=classes,
+            exact_types=frozenset(classes),
+            allow_none=allow_none,
+            checks=checks,
+            # Only predicates and callables are worth caching, built-in validators
+            # are cheaper than a cache lookup. Like memoization, this assumes the
+            # predicates are pure, so it's opt-in as well.
+            cache_results=has_functions and memoize_predicates,
+        )
+
+    def _generate(self) -> _Matcher | None:
+        """
+        Generate the specialized matcher of this matcher.
+
+        Only done once, for matchers compared often enough to pay for it.
+
+        Returns:
+            The generated matcher, or None if there are too many validators
+        """
+        spec = self._get_spec()
+        self._comparisons = _GENERATE_AFTER
+        self._match = self._generate_matcher(
+            spec.types, spec.allow_none, spec.checks, self._validators
+        )
+        return self._match
+
+    @staticmethod
     def _parse_type_constraint(
-        self, type_constraint: typing.Any
+        type_constraint: typing.Any,
     ) -> tuple[type | None, ...]:
         """
         Parse the type constraint into a tuple of accepted types.
@@ -59,36 +306,46 @@ class AnyValue(typing.Generic[T]):
         Returns:
             A tuple of types (or None) that are accepted
         """
+        # Fast path for the most common case, a single concrete class
+        if isinstance(type_constraint, type) and type_constraint is not type(None):
+            return (type_constraint,)
+
         # Handle None type explicitly
         if type_constraint is None or type_constraint is type(None):
             return (None,)
 
-        # Handle union types (Python 3.10+ syntax: int | str)
-        origin = typing.get_origin(type_constraint)
-        if origin is types.UnionType:
-            # Extract types from union
-            args = typing.get_args(type_constraint)
+        # Handle union types (int | str, typing.Union[int, str] or typing.Optional).
+        # Their members are read straight from __args__, which is what
+        # typing.get_args() does, minus its dispatch on every generic alias kind.
+        if isinstance(type_constraint, types.UnionType) or (
+            getattr(type_constraint, "__origin__", None) is typing.Union
+        ):
+            args = type_constraint.__args__
             return tuple(None if arg is type(None) else arg for arg in args)
 
-        # Handle single type
+        # Handle any other single type (e.g. list[int], typing.Any)
         return (type_constraint,)
 
-    def _format_type_constraint(self) -> str:
+    @staticmethod
+    def _format_type_constraint(accepted_types: tuple[type | None, ...]) -> str:
         """
-        Format the type constraint as a readable string.
+        Format the accepted types as a readable string.
+
+        Args:
+            accepted_types: The accepted types, as returned by _parse_type_constraint
 
         Returns:
             A formatted string representation of the type constraint
         """
         type_names = []
-        for t in self._accepted_types:
+        for t in accepted_types:
             if t is None:
                 type_names.append("None")
             else:
                 type_names.append(getattr(t, "__name__", str(t)))
         return " | ".join(type_names)
 
-    def _check_type(self, other: typing.Any) -> tuple[bool, str | None]:
+    def _check_type(self, other: typing.Any) -> _Failure | None:
         """
         Check if the value matches the type constraint.
 
@@ -96,27 +353,289 @@ class AnyValue(typing.Generic[T]):
             other: The value to check
 
         Returns:
-            A tuple of (passed, failure_reason). If passed is True, failure_reason is None.
+            None if the value passed, the failure otherwise.
         """
+        spec = self._get_spec()
+
         # Check if None is allowed
         if other is None:
-            if None in self._accepted_types:
-                return (True, None)
+            if spec.allow_none:
+                return None
+            return _Failure(None, other, None)
+
+        # Exact type hits skip isinstance, which walks the MRO of the value for
+        # each accepted type that doesn't match. Subclasses (e.g. bool for int)
+        # still go through isinstance.
+        if type(other) in spec.exact_types or isinstance(other, spec.types):
+            return None
+
+        return _Failure(None, other, None)
+
+    @staticmethod
+    def _compile_validator(
+        validator: typing.Any, constraint: str | None
+    ) -> _Check | None:
+        """
+        Resolve a validator into a function checking a single value.
+
+        Args:
+            validator: The validator to compile
+            constraint: The constraint the validator is, as returned by _constraint()
+
+        Returns:
+            A function returning a truthy value if the value passes the validator,
+            or None if the validator type is unknown and should be skipped.
+        """
+        # Comparisons keep the value on the left, like the generated matchers,
+        # so that unorderable values raise the same error on both paths
+        if constraint == "Ge":
+            ge = validator.ge
+            return lambda v: v >= ge
+        if constraint == "Le":
+            le = validator.le
+            return lambda v: v <= le
+        if constraint == "Gt":
+            gt = validator.gt
+            return lambda v: v > gt
+        if constraint == "Lt":
+            lt = validator.lt
+            return lambda v: v < lt
+        if constraint == "Len":
+            min_length = validator.min_length or 0
+            max_length = validator.max_length
+            if max_length is None:
+                return lambda v: len(v) >= min_length
+            if min_length == max_length:
+                return lambda v: len(v) == min_length
+            return lambda v: min_length <= len(v) <= max_length
+        if constraint == "MultipleOf":
+            multiple_of = validator.multiple_of
+            return lambda v: v % multiple_of == 0
+        if constraint == "Predicate":
+            return validator.func
+        if callable(validator):
+            return typing.cast(_Check, validator)
+        return None
+
+    @staticmethod
+    def _share(wrap: "functools._lru_cache_wrapper[_Check]", func: _Check) -> _Check:
+        """
+        Wrap a predicate once for every matcher using it.
+
+        Args:
+            wrap: The cached wrapper, _jit_compile or _memoize
+            func: The predicate to wrap
+
+        Returns:
+            The wrapped predicate, only shared if the predicate is hashable
+        """
+        try:
+            return wrap(func)
+        except TypeError:
+            return wrap.__wrapped__(func)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=_SHARED_PREDICATES_SIZE)
+    def _jit_compile(func: _Check) -> _Check:
+        """
+        JIT-compile a predicate with Numba, falling back to the plain function.
+
+        Numba compiles lazily on the first call for each argument type, so a
+        predicate it can't compile (e.g. one working on strings) is only detected
+        then: from that point on, the plain function is used.
+
+        Args:
+            func: The predicate to compile
+
+        Returns:
+            A function calling the compiled predicate when possible
+        """
+        # Raises ImportError if numba isn't installed: jit=True is an explicit opt-in
+        numba = importlib.import_module("numba")
+        if not isinstance(func, types.FunctionType):
+            # Numba only compiles plain Python functions, not builtins or partials
+            return func
+        compiled: _Check | None = numba.njit(func)
+        numba_error = numba.core.errors.NumbaError
+
+        def check(value: typing.Any) -> typing.Any:
+            nonlocal compiled
+            if compiled is not None:
+                try:
+                    return compiled(value)
+                except numba_error:
+                    compiled = None
+                except (OverflowError, TypeError, ValueError):
+                    # The value can't be converted to a native type of an already
+                    # compiled signature, e.g. an int beyond 64 bits: only this
+                    # value is checked with the plain function
+                    pass
+            return func(value)
+
+        return check
+
+    @staticmethod
+    @functools.lru_cache(maxsize=_SHARED_PREDICATES_SIZE)
+    def _memoize(func: _Check) -> _Check:
+        """
+        Cache the results of a predicate by argument value.
+
+        Unlike the per-matcher result cache, which is keyed by identity and
+        restricted to immutable builtins, this one is shared by every matcher
+        using the predicate and works with any hashable value equal to a previous one.
+        Unhashable values are passed straight to the predicate.
+
+        Args:
+            func: The predicate to memoize
+
+        Returns:
+            A function returning the cached result when possible
+        """
+        # typed=True keeps 1, 1.0 and True apart
+        cached = functools.lru_cache(maxsize=256, typed=True)(func)
+
+        def check(value: typing.Any) -> typing.Any:
+            try:
+                hash(value)
+            except TypeError:
+                return func(value)
+            return cached(value)
+
+        return check
+
+    @staticmethod
+    def _generate_matcher(
+        classes: tuple[type, ...],
+        allow_none: bool,
+        checks: tuple[tuple[_Check, int], ...],
+        validators: tuple[typing.Any, ...],
+    ) -> _Matcher | None:
+        """
+        Generate a matcher function specialized for the given constraints.
+
+        The type check and validators are unrolled into straight-line code, with
+        the validator bounds and functions bound as closure variables. Factories
+        are cached by source code, so matchers of the same shape share their
+        bytecode.
+
+        Args:
+            classes: The accepted types, None excluded
+            allow_none: Whether None is accepted
+            checks: The compiled validators, as (check, validator position) pairs
+            validators: The validators the checks were compiled from
+
+        Returns:
+            A function returning None if the value matches, the failure otherwise,
+            or None if there are too many validators to unroll.
+        """
+        if len(checks) > _MAX_GENERATED_CHECKS:
+            return None
+
+        params = ["Failure"]
+        args: list[typing.Any] = [_Failure]
+        if len(classes) == 1:
+            # isinstance against a single class is cheaper than a set lookup
+            params.append("cls")
+            args.append(classes[0])
+            type_check = "isinstance(other, cls)"
+        else:
+            params += ["exact_types", "classes"]
+            args += [frozenset(classes), classes]
+            type_check = "(type(other) in exact_types or isinstance(other, classes))"
+        # None is settled before any isinstance call; validators don't apply to it
+        none_result = "None" if allow_none else "Failure(None, other, None)"
+        body = [
+            "    if other is None:",
+            f"        return {none_result}",
+            f"    if not {type_check}:",
+            "        return Failure(None, other, None)",
+        ]
+
+        for i, (check, index) in enumerate(checks):
+            validator = validators[index]
+            constraint = _constraint(validator)
+            if constraint == "Len":
+                params += [f"lo{i}", f"hi{i}"]
+                args += [validator.min_length or 0, validator.max_length]
+                if validator.max_length is None:
+                    expr = f"len(other) >= lo{i}"
+                elif validator.min_length == validator.max_length:
+                    expr = f"len(other) == lo{i}"
+                else:
+                    expr = f"lo{i} <= len(other) <= hi{i}"
+            elif constraint in _INLINE_CONSTRAINTS:
+                attribute, template = _INLINE_CONSTRAINTS[constraint]
+                params.append(f"a{i}")
+                args.append(getattr(validator, attribute))
+                expr = template.format(f"a{i}")
             else:
-                expected = self._format_type_constraint()
-                return (False, f"Expected type {expected}, got None")
+                # Predicates and callables are called directly
+                params.append(f"f{i}")
+                args.append(check)
+                expr = f"f{i}(other)"
+            body += [
+                "    try:",
+                f"        if not ({expr}):",
+                f"            return Failure({index}, other, None)",
+                "    except Exception as e:",
+                f"        return Failure({index}, other, e)",
+            ]
+        body.append("    return None")
+
+        source = "\n".join(
+            [
+                f"def factory({', '.join(params)}):",
+                "  def match(other):",
+                *(f"  {line}" for line in body),
+                "  return match",
+            ]
+        )
+        factory = _MATCHER_FACTORIES.get(source)
+        if factory is None:
+            namespace: dict[str, typing.Any] = {}
+            exec(compile(source, "<anyvalue matcher>", "exec"), namespace)
+            factory = _MATCHER_FACTORIES[source] = namespace["factory"]
+        return factory(*args)
+
+    @staticmethod
+    def _describe_failure(validator: typing.Any, other: typing.Any) -> str:
+        """
+        Describe why a value didn't pass a validator.
 
-        # Check if the value's type matches any accepted type
-        for accepted_type in self._accepted_types:
-            if accepted_type is not None and isinstance(other, accepted_type):
-                return (True, None)
+        Only called for failed comparisons, so passing values never pay for
+        building the message.
 
-        # Type mismatch
-        actual_type = type(other).__name__
-        expected = self._format_type_constraint()
-        return (False, f"Expected type {expected}, got {actual_type} ({other!r})")
+        Args:
+            validator: The validator that failed
+            other: The value that failed the validator
 
-    def _check_validators(self, other: typing.Any) -> tuple[bool, str | None]:
+        Returns:
+            A human-readable failure reason
+        """
+        constraint = _constraint(validator)
+        if constraint == "Ge":
+            return f"Validator {validator} failed: {other!r} is not >= {validator.ge}"
+        if constraint == "Le":
+            return f"Validator {validator} failed: {other!r} is not <= {validator.le}"
+        if constraint == "Gt":
+            return f"Validator {validator} failed: {other!r} is not > {validator.gt}"
+        if constraint == "Lt":
+            return f"Validator {validator} failed: {other!r} is not < {validator.lt}"
+        if constraint == "Len":
+            length = len(other)
+            if validator.min_length is not None and length < validator.min_length:
+                return f"Validator {validator} failed: length {length} is less than min {validator.min_length}"
+            return f"Validator {validator} failed: length {length} exceeds max {validator.max_length}"
+        if constraint == "MultipleOf":
+            return f"Validator {validator} failed: {other!r} is not a multiple of {validator.multiple_of}"
+        if constraint == "Predicate":
+            return f"Predicate validator failed for {other!r}"
+        validator_name = getattr(validator, "__name__", None)
+        if validator_name:
+            return f"Custom validator '{validator_name}' failed for {other!r}"
+        return f"Custom validator failed for {other!r}"
+
+    def _check_validators(self, other: typing.Any) -> _Failure | None:
         """
         Check if the value passes all validators.
 
@@ -124,93 +643,146 @@ class AnyValue(typing.Generic[T]):
             other: The value to validate
 
         Returns:
-            A tuple of (passed, failure_reason). If passed is True, failure_reason is None.
+            None if the value passed, the failure otherwise.
         """
-        if not self.validators:
-            return (True, None)
-
-        # Apply each validator
-        for validator in self.validators:
+        for check, index in self._get_spec().checks:
             try:
-                # Handle annotated-types validators
-                if isinstance(validator, Ge):
-                    if not (other >= validator.ge):
-                        return (
-                            False,
-                            f"Validator {validator} failed: {other!r} is not >= {validator.ge}",
-                        )
-                elif isinstance(validator, Le):
-                    if not (other <= validator.le):
-                        return (
-                            False,
-                            f"Validator {validator} failed: {other!r} is not <= {validator.le}",
-                        )
-                elif isinstance(validator, Gt):
-                    if not (other > validator.gt):
-                        return (
-                            False,
-                            f"Validator {validator} failed: {other!r} is not > {validator.gt}",
-                        )
-                elif isinstance(validator, Lt):
-                    if not (other < validator.lt):
-                        return (
-                            False,
-                            f"Validator {validator} failed: {other!r} is not < {validator.lt}",
-                        )
-                elif isinstance(validator, Len):
-                    # Check length constraints
-                    try:
-                        length = len(other)
-                        if (
-                            validator.min_length is not None
-                            and length < validator.min_length
-                        ):
-                            return (
-                                False,
-                                f"Validator {validator} failed: length {length} is less than min {validator.min_length}",
-                            )
-                        if (
-                            validator.max_length is not None
-                            and length > validator.max_length
-                        ):
-                            return (
-                                False,
-                                f"Validator {validator} failed: length {length} exceeds max {validator.max_length}",
-                            )
-                    except TypeError:
-                        # Object doesn't have a length
-                        return (
-                            False,
-                            f"Validator {validator} failed: {other!r} has no length",
-                        )
-                elif isinstance(validator, MultipleOf):
-                    if not (other % validator.multiple_of == 0):
-                        return (
-                            False,
-                            f"Validator {validator} failed: {other!r} is not a multiple of {validator.multiple_of}",
-                        )
-                elif isinstance(validator, Predicate):
-                    if not validator.func(other):
-                        return (False, f"Predicate validator failed for {other!r}")
-                elif callable(validator):
-                    # Try calling the validator
-                    if not validator(other):
-                        validator_name = getattr(validator, "__name__", None)
-                        if validator_name:
-                            return (
-                                False,
-                                f"Custom validator '{validator_name}' failed for {other!r}",
-                            )
-                        else:
-                            return (False, f"Custom validator failed for {other!r}")
-                else:
-                    # Unknown validator type, skip
+                if check(other):
                     continue
             except Exception as e:
                 # If validation fails with an exception, consider it failed
-                return (False, f"Validator {validator} raised exception: {e}")
+                return _Failure(index, other, e)
+            return _Failure(index, other, None)
+
+        return None
 
-        return (True, None)
+    def _interpret(self, other: typing.Any) -> _Failure | None:
+        """
+        Check a value straight from the matcher arguments, without a spec.
+
+        Used for the first comparison: most matchers are only compared once,
+        and checking their arguments directly costs less than parsing them.
+
+        Args:
+            other: The value to check
+
+        Returns:
+            None if the value passed, the failure otherwise.
+        """
+        accepted_types = self._parse_type_constraint(self._type_constraint)
+        if other is None:
+            # Validators don't apply to an accepted None
+            return None if None in accepted_types else _Failure(None, other, None)
+        classes = typing.cast("tuple[type, ...]", accepted_types)
+        if None in accepted_types:
+            classes = tuple(t for t in accepted_types if t is not None)
+        if not isinstance(other, classes):
+            return _Failure(None, other, None)
+
+        for index, validator in enumerate(self._validators):
+            constraint = _constraint(validator)
+            comparison = _COMPARISONS.get(constraint)
+            try:
+                if comparison is not None:
+                    attribute, compare = comparison
+                    if compare(other, getattr(validator, attribute)):
+                        continue
+                else:
+                    check = self._compile_validator(validator, constraint)
+                    if check is None or check(other):
+                        continue
+            except Exception as e:
+                return _Failure(index, other, e)
+            return _Failure(index, other, None)
+
+        return None
+
+    def _check(self, other: typing.Any) -> _Failure | None:
+        """
+        Check a value against the type constraint and validators.
+
+        Generic counterpart of the generated matchers.
+
+        Args:
+            other: The value to check
+
+        Returns:
+            None if the value passed, the failure otherwise.
+        """
+        failure = self._check_type(other)
+        # Validators don't apply to an accepted None
+        if failure is None and other is not None:
+            failure = self._check_validators(other)
+        return failure
+
+    def _format_failure(self, failure: _Failure) -> str:
+        """
+        Format a recorded failure as a human-readable reason.
+
+        Args:
+            failure: The failure to format
+
+        Returns:
+            The failure reason
+        """
+        index, other, error = failure
+        if index is None:
+            type_repr = self._format_type_constraint(
+                self._parse_type_constraint(self._type_constraint)
+            )
+            if other is None:
+                return f"Expected type {type_repr}, got None"
+            actual_type = type(other).__name__
+            return f"Expected type {type_repr}, got {actual_type} ({other!r})"
+        validator = self._validators[index]
+        if error is not None:
+            if isinstance(error, TypeError) and _constraint(validator) == "Len":
+                # Object doesn't have a length
+                return f"Validator {validator} failed: {other!r} has no length"
+            return f"Validator {validator} raised exception: {error}"
+        return self._describe_failure(validator, other)
+
+    def _record(self, failure: _Failure | None) -> str | None:
+        """
+        Record the failure reason of the last comparison, shown by repr().
+
+        The reason is formatted right away: the value could be mutated before
+        the matcher is printed.
+
+        Args:
+            failure: The failure of the comparison, None if it succeeded
+
+        Returns:
+            The failure reason, or None if the comparison succeeded
+        """
+        reason = None if failure is None else self._format_failure(failure)
+        self._last_failure_reason = reason
+        return reason
+
+    def match_many(self, values: typing.Iterable[typing.Any]) -> list[bool]:
+        """
+        Check many values at once.
+
+        Runs the matcher over every value in a single comprehension, without
+        going through == for each of them. Unlike ==, it doesn't record the
+        failure reason shown in the representation of the matcher.
+
+        Examples:
+            >>> AnyValue(int, Ge(0)).match_many([1, -1, "a"])
+            [True, False, False]
+
+        Args:
+            values: The values to check
+
+        Returns:
+            Whether each value matches the type and validators, in order
+        """
+        match = self._match
+        if match is None and self._comparisons < _GENERATE_AFTER:
+            match = self._generate()
+        if match is None:
+            match = self._check
+        return [match(value) is None for value in values]
 
     def __eq__(self, other: typing.Any) -> typing.TypeGuard[T]:
         """
@@ -223,22 +795,52 @@ class AnyValue(typing.Generic[T]):
             other: The value to compare against
 
         Returns:
-            True if the value matches the type and validators, False otherwise
+            True if the value matches the type and validators, False otherwise.
+            Never NotImplemented, so Python doesn't fall back to the reflected
+            comparison or identity.
         """
-        # Check type constraint
-        type_passed, type_reason = self._check_type(other)
-        if not type_passed:
-            self._last_failure_reason = type_reason
-            return False
-
-        # Check validators
-        validator_passed, validator_reason = self._check_validators(other)
-        if not validator_passed:
-            self._last_failure_reason = validator_reason
-            return False
-
-        self._last_failure_reason = None
-        return True
+        # Besides result cache entries, the success path allocates nothing:
+        # matchers return None, failure records and reasons are only built on
+        # failure.
+
+        spec = self._spec
+        if spec is None:
+            # Memoizing matchers need their spec to cache the first result
+            if not self._comparisons and not self._memoize_predicates:
+                self._comparisons = 1
+                return self._record(self._interpret(other)) is None
+            spec = self._get_spec()
+
+        # Reuse the result of a previous comparison with the very same value.
+        # Only immutable values are cached, so the value itself can't change.
+        cacheable = spec.cache_results and type(other) in _CACHEABLE_TYPES
+        if cacheable and self._results is not None:
+            cached = self._results.get(id(other))
+            if cached is not None and cached[0] is other:
+                reason = self._last_failure_reason = cached[1]
+                return reason is None
+
+        match = self._match
+        if match is not None:
+            failure = match(other)
+        else:
+            failure = self._check(other)
+            self._comparisons += 1
+            if self._comparisons == _GENERATE_AFTER:
+                self._generate()
+        reason = self._record(failure)
+
+        if cacheable:
+            results = self._results
+            if results is None:
+                results = self._results = {}
+            elif len(results) >= _RESULT_CACHE_SIZE:
+                # Evict the oldest entry
+                del results[next(iter(results))]
+            # Keeping a reference to the value guarantees its id isn't reused
+            results[id(other)] = (other, reason)
+
+        return reason is None
 
     def __ne__(self, other: typing.Any) -> bool:
         """
@@ -252,6 +854,25 @@ class AnyValue(typing.Generic[T]):
         """
         return not self.__eq__(other)
 
+    def __hash__(self) -> int:
+        """
+        Return the hash of the matcher, computed once on first use.
+
+        Defining __eq__ would otherwise make matchers unhashable. Matchers don't
+        hash like the values they are equal to, so they can't be used to look
+        values up in sets or dicts.
+
+        Returns:
+            The hash of the matcher
+        """
+        if self._hash is None:
+            try:
+                self._hash = hash((self._type_constraint, self._validators))
+            except TypeError:
+                # Matchers with unhashable arguments are hashed by identity
+                self._hash = object.__hash__(self)
+        return self._hash
+
     def __repr__(self) -> str:
         """
         Return a string representation of the AnyValue matcher.
@@ -259,15 +880,21 @@ class AnyValue(typing.Generic[T]):
         Returns:
             A string describing the matcher
         """
-        type_str = self._format_type_constraint()
-        if self.validators:
-            validator_strs = [str(v) for v in self.validators]
-            result = f"AnyValue({type_str}, {', '.join(validator_strs)})"
-        else:
-            result = f"AnyValue({type_str})"
+        result = self._repr
+        if result is None:
+            type_repr = self._format_type_constraint(
+                self._parse_type_constraint(self._type_constraint)
+            )
+            if self._validators:
+                validator_strs = [str(v) for v in self._validators]
+                result = f"AnyValue({type_repr}, {', '.join(validator_strs)})"
+            else:
+                result = f"AnyValue({type_repr})"
+            # Equal representations share one string across matchers
+            result = self._repr = sys.intern(result)
 
         # Add failure reason if available (for better pytest output)
-        if self._last_failure_reason:
+        if self._last_failure_reason is not None:
             result += f"\n  Reason: {self._last_failure_reason}"
 
         return result
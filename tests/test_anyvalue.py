@@ -1,12 +1,18 @@
+import dataclasses
+import functools
+import operator
+import subprocess
+import sys
 import typing
-from datetime import datetime
+import weakref
+from datetime import date, datetime
 from math import isqrt
 from unittest.mock import Mock
 
 import pytest
-from annotated_types import Ge, Le, Len, Predicate
+from annotated_types import Ge, Gt, Le, Len, Lt, MultipleOf, Predicate
 
-from anyvalue import AnyValue
+from anyvalue import _GENERATE_AFTER, AnyValue
 
 
 def test_basic_type_matching() -> None:
@@ -61,6 +67,15 @@ def test_union_types() -> None:
     assert "test" == AnyValue(int | float | str)
 
 
+def test_union_types_subclasses() -> None:
+    """Test that subclasses of union members are accepted."""
+    assert True == AnyValue(int | str)  # noqa: E712
+    assert True == AnyValue(int | str, Ge(0))  # noqa: E712
+    assert True == AnyValue(int | str, Predicate(bool))  # noqa: E712
+    assert datetime.now() == AnyValue(str | date)
+    assert 3.14 != AnyValue(str | date)
+
+
 def test_none_support() -> None:
     """Test None type support."""
     # None type explicitly
@@ -79,6 +94,25 @@ def test_none_support() -> None:
     assert not (None == AnyValue(int))  # noqa: E711
     assert not (None == AnyValue(str))  # noqa: E711
 
+    # Validators don't apply to None
+    assert None == AnyValue(int | None, Ge(0))  # noqa: E711
+    assert None == AnyValue(str | None, Len(1, 10), Predicate(str.isupper))  # noqa: E711
+    assert None == AnyValue(None, lambda x: x is not None)  # noqa: E711
+    assert -1 != AnyValue(int | None, Ge(0))
+
+
+def test_typing_union() -> None:
+    """Test union types built with typing.Union and typing.Optional."""
+    assert 42 == AnyValue(typing.Union[int, str])  # noqa: UP007
+    assert "test" == AnyValue(typing.Union[int, str])  # noqa: UP007
+    assert 3.14 != AnyValue(typing.Union[int, str])  # noqa: UP007
+
+    assert None == AnyValue(typing.Optional[int])  # noqa: E711, UP045
+    assert 42 == AnyValue(typing.Optional[int])  # noqa: UP045
+    assert "test" != AnyValue(typing.Optional[int])  # noqa: UP045
+
+    assert repr(AnyValue(typing.Optional[int])) == "AnyValue(int | None)"  # noqa: UP045
+
 
 def test_annotated_types_ge() -> None:
     """Test annotated-types Ge (greater or equal) constraint."""
@@ -342,6 +376,42 @@ def test_repr_exact_representation(
             "AnyValue(str, Len(min_length=5, max_length=5))\n  Reason: Validator Len(min_length=5, max_length=5) failed: length 2 is less than min 5",
             id="str_len_validator_failure",
         ),
+        pytest.param(
+            AnyValue(str, Len(0, 2)),
+            "hello",
+            "AnyValue(str, Len(min_length=0, max_length=2))\n  Reason: Validator Len(min_length=0, max_length=2) failed: length 5 exceeds max 2",
+            id="str_len_max_validator_failure",
+        ),
+        pytest.param(
+            AnyValue(int, Len(1, 2)),
+            42,
+            "AnyValue(int, Len(min_length=1, max_length=2))\n  Reason: Validator Len(min_length=1, max_length=2) failed: 42 has no length",
+            id="int_len_no_length",
+        ),
+        pytest.param(
+            AnyValue(int, Gt(0), Lt(10)),
+            10,
+            "AnyValue(int, Gt(gt=0), Lt(lt=10))\n  Reason: Validator Lt(lt=10) failed: 10 is not < 10",
+            id="int_lt_validator_failure",
+        ),
+        pytest.param(
+            AnyValue(int, MultipleOf(3)),
+            10,
+            "AnyValue(int, MultipleOf(multiple_of=3))\n  Reason: Validator MultipleOf(multiple_of=3) failed: 10 is not a multiple of 3",
+            id="int_multiple_of_validator_failure",
+        ),
+        pytest.param(
+            AnyValue(str | int, Ge(0)),
+            "hello",
+            "AnyValue(str | int, Ge(ge=0))\n  Reason: Validator Ge(ge=0) raised exception: '>=' not supported between instances of 'str' and 'int'",
+            id="validator_exception",
+        ),
+        pytest.param(
+            AnyValue(str | int, Ge(0), Le(9), Gt(-1), Lt(10), MultipleOf(1)),
+            "hello",
+            "AnyValue(str | int, Ge(ge=0), Le(le=9), Gt(gt=-1), Lt(lt=10), MultipleOf(multiple_of=1))\n  Reason: Validator Ge(ge=0) raised exception: '>=' not supported between instances of 'str' and 'int'",
+            id="generic_validator_exception",
+        ),
     ],
 )
 def test_repr_with_validation_failures(
@@ -355,3 +425,478 @@ def test_repr_with_validation_failures(
     # Check that repr matches exactly
     repr_str = repr(matcher)
     assert repr_str == expected_repr
+
+
+def test_repr_interning() -> None:
+    """Test that matchers built from equal arguments share their representation."""
+    # The representation is built once per matcher, and interned
+    assert repr(AnyValue(int, Ge(0))) is repr(AnyValue(int, Ge(0)))
+
+    # Failure reasons stay per-instance
+    failing = AnyValue(int)
+    assert "hello" != failing
+    assert repr(failing) != repr(AnyValue(int))
+    assert repr(AnyValue(int)) == "AnyValue(int)"
+
+
+@pytest.mark.parametrize("reverse", [False, True], ids=["forward", "reverse"])
+@pytest.mark.parametrize(
+    "first,second,value",
+    [
+        pytest.param(
+            (
+                (int | str,),
+                "AnyValue(int | str)\n  Reason: Expected type int | str, got float (1.5)",
+            ),
+            (
+                (str | int,),
+                "AnyValue(str | int)\n  Reason: Expected type str | int, got float (1.5)",
+            ),
+            1.5,
+            id="union_order",
+        ),
+        pytest.param(
+            (
+                (typing.Optional[int],),  # noqa: UP045
+                "AnyValue(int | None)\n  Reason: Expected type int | None, got str ('a')",
+            ),
+            (
+                (None | int,),
+                "AnyValue(None | int)\n  Reason: Expected type None | int, got str ('a')",
+            ),
+            "a",
+            id="optional_order",
+        ),
+        pytest.param(
+            (
+                (int, Ge(1)),
+                "AnyValue(int, Ge(ge=1))\n  Reason: Validator Ge(ge=1) failed: 0 is not >= 1",
+            ),
+            (
+                (int, Ge(True)),
+                "AnyValue(int, Ge(ge=True))\n  Reason: Validator Ge(ge=True) failed: 0 is not >= True",
+            ),
+            0,
+            id="bool_bound",
+        ),
+        pytest.param(
+            (
+                (int | str, Ge(1)),
+                "AnyValue(int | str, Ge(ge=1))\n  Reason: Validator Ge(ge=1) raised exception: '>=' not supported between instances of 'str' and 'int'",
+            ),
+            (
+                (int | str, Ge(1.0)),
+                "AnyValue(int | str, Ge(ge=1.0))\n  Reason: Validator Ge(ge=1.0) raised exception: '>=' not supported between instances of 'str' and 'float'",
+            ),
+            "a",
+            id="float_bound",
+        ),
+    ],
+)
+def test_equal_arguments(
+    first: tuple[tuple[typing.Any, ...], str],
+    second: tuple[tuple[typing.Any, ...], str],
+    value: object,
+    reverse: bool,
+) -> None:
+    """Test that matchers built from equal but different arguments don't share output."""
+    cases = [second, first] if reverse else [first, second]
+    for args, expected_repr in cases:
+        matcher = AnyValue(*args)
+        assert value != matcher
+        assert repr(matcher) == expected_repr
+
+
+def test_dataclass_validator() -> None:
+    """Test a dataclass, rather than one of its instances, used as a validator."""
+
+    @dataclasses.dataclass
+    class Positive:
+        value: int
+
+        def __bool__(self) -> bool:
+            return self.value > 0
+
+    assert 5 == AnyValue(int, Positive)
+    assert -1 != AnyValue(int, Positive)
+
+
+def test_unhashable_validator() -> None:
+    """Test unhashable callable validators."""
+
+    class NonEmpty:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __call__(self, value: str) -> bool:
+            return len(value) > 0
+
+    assert "hello" == AnyValue(str, NonEmpty())
+    assert "" != AnyValue(str, NonEmpty())
+
+
+def test_matcher_doesnt_outlive_its_validators() -> None:
+    """Test that nothing keeps the validators of a discarded matcher alive."""
+
+    class Allowed:
+        values = {5}
+
+    allowed = Allowed()
+    allowed_ref = weakref.ref(allowed)
+    assert 5 == AnyValue(int, lambda x: x in allowed.values)
+    assert 5 == AnyValue(int, Ge(0), lambda x: x in allowed.values)
+
+    del allowed
+    assert allowed_ref() is None
+
+
+def test_matcher_arguments_are_read_only() -> None:
+    """Test that the matcher arguments can't be swapped after construction."""
+    matcher = AnyValue(int, Ge(0))
+    assert matcher.type_constraint is int
+    assert matcher.validators == (Ge(0),)
+
+    with pytest.raises(AttributeError):
+        matcher.validators = (Le(0),)  # type: ignore[misc]
+
+
+def test_result_cache() -> None:
+    """Test that repeated comparisons with the same value reuse the result."""
+    calls: list[int] = []
+
+    def is_even(value: int) -> bool:
+        calls.append(value)
+        return value % 2 == 0
+
+    matcher = AnyValue(int, is_even, memoize_predicates=True)
+    value = 10**20
+    assert value == matcher
+    assert value == matcher
+    assert calls == [value]
+    assert matcher._results is not None
+    assert matcher._results[id(value)] == (value, None)
+
+    # Failure reasons are restored from the cache as well
+    odd = 10**20 + 1
+    assert odd != matcher
+    assert odd != matcher
+    assert calls == [value, odd]
+    assert repr(matcher) == (
+        f"AnyValue(int, {is_even!r})\n"
+        f"  Reason: Custom validator 'is_even' failed for {odd!r}"
+    )
+
+    # Mutable values are always re-checked
+    def is_single(value: list[int]) -> bool:
+        return len(value) == 1
+
+    list_matcher = AnyValue(list, is_single, memoize_predicates=True)
+    items = [1]
+    assert items == list_matcher
+    items.append(2)
+    assert items != list_matcher
+
+    # Without memoize_predicates, impure predicates see every comparison
+    allowed = {5}
+    impure_matcher = AnyValue(int, lambda x: x in allowed)
+    assert 5 == impure_matcher
+    allowed.clear()
+    assert 5 != impure_matcher
+    assert impure_matcher._results is None
+
+    # Matchers without predicates or callables never create the cache
+    ge_matcher = AnyValue(int, Ge(0))
+    assert 10**20 == ge_matcher
+    assert ge_matcher._results is None
+
+
+def test_failure_reason_reflects_last_comparison() -> None:
+    """Test that the failure reason reflects the last comparison only."""
+    matcher = AnyValue(int, Ge(0))
+
+    assert None != matcher  # noqa: E711
+    assert (
+        repr(matcher)
+        == "AnyValue(int, Ge(ge=0))\n  Reason: Expected type int, got None"
+    )
+
+    assert 42 == matcher
+    assert repr(matcher) == "AnyValue(int, Ge(ge=0))"
+
+
+@pytest.mark.parametrize("comparisons", [1, 2], ids=["interpreted", "spec"])
+def test_failure_reason_outlives_mutation(comparisons: int) -> None:
+    """Test that the failure reason describes the value when it was compared."""
+    matcher = AnyValue(list, Len(1, 2))
+    value = [1, 2, 3]
+    for _ in range(comparisons):
+        assert value != matcher
+    value.clear()
+    assert repr(matcher) == (
+        "AnyValue(list, Len(min_length=1, max_length=2))\n"
+        "  Reason: Validator Len(min_length=1, max_length=2) failed: "
+        "length 3 exceeds max 2"
+    )
+
+
+def test_first_comparison_is_interpreted() -> None:
+    """Test that one-off comparisons don't parse the matcher arguments."""
+    matcher = AnyValue(str | int, Ge(0), Len(0, 2))
+    assert "hello" != matcher
+    assert matcher._spec is None
+    interpreted_repr = repr(matcher)
+
+    # Later comparisons use the parsed spec, and fail the same way
+    assert "hello" != matcher
+    assert matcher._spec is not None
+    assert repr(matcher) == interpreted_repr
+
+
+def test_generated_matcher() -> None:
+    """Test that matchers compared repeatedly get a generated matcher shared by shape."""
+    matcher = AnyValue(int, Ge(0), Le(100))
+    # One-off comparisons don't pay for generating code
+    assert 50 == matcher
+    assert matcher._match is None
+
+    for value in range(1, _GENERATE_AFTER):
+        assert value == matcher
+    match = matcher._match
+    assert match is not None
+    assert 50 == matcher
+    assert -1 != matcher
+    assert 101 != matcher
+    assert "50" != matcher
+    assert repr(matcher).endswith("Reason: Expected type int, got str ('50')")
+
+    # Matchers of the same shape share their bytecode
+    other = AnyValue(float, Ge(1.5), Le(2.5))
+    assert other.match_many([2.0, 3.0]) == [True, False]
+    assert other._match is not None
+    assert other._match.__code__ is match.__code__
+
+    # Predicates and callables are called from the generated code
+    is_even = Predicate(lambda x: x % 2 == 0)
+    predicate_matcher = AnyValue(int, Ge(0), is_even)
+    assert predicate_matcher.match_many([42, 43]) == [True, False]
+    assert predicate_matcher._match is not None
+    assert 42 == predicate_matcher
+    assert 43 != predicate_matcher
+
+
+def test_generic_matcher() -> None:
+    """Test long validator lists, which use the generic loop."""
+    matcher = AnyValue(
+        int | str,
+        Gt(0),
+        Ge(1),
+        Lt(100),
+        Le(99),
+        MultipleOf(2),
+        Predicate(lambda x: x != 50),
+    )
+    assert matcher.match_many(range(_GENERATE_AFTER)) == [
+        value % 2 == 0 and 0 < value != 50 for value in range(_GENERATE_AFTER)
+    ]
+    assert matcher._match is None
+
+    assert 42 == matcher
+    assert True != matcher  # noqa: E712
+    assert None != matcher  # noqa: E711
+    assert None == AnyValue(int | None, Gt(0), Ge(1), Lt(100), Le(99), MultipleOf(2))  # noqa: E711
+    assert 3.14 != matcher
+    assert 50 != matcher
+    assert repr(matcher).endswith("Reason: Predicate validator failed for 50")
+    assert "hello" != matcher
+    assert "Reason: Validator Gt(gt=0) raised exception" in repr(matcher)
+
+
+def test_operator_validator() -> None:
+    """Test operator functions bound with functools.partial as validators."""
+    is_positive = functools.partial(operator.lt, 0)
+    assert 42 == AnyValue(int, is_positive)
+    assert 0 != AnyValue(int, is_positive)
+
+    is_color = functools.partial(operator.contains, {"red", "green", "blue"})
+    assert "red" == AnyValue(str, is_color)
+    assert "pink" != AnyValue(str, is_color)
+
+
+def test_hash() -> None:
+    """Test that matchers are hashable and can be used in sets and dicts."""
+    assert hash(AnyValue(int, Ge(0))) == hash(AnyValue(int, Ge(0)))
+    assert hash(AnyValue(int | None)) == hash(AnyValue(int | None))
+
+    matcher = AnyValue(str, Len(1, 10))
+    assert matcher in {matcher}
+    assert {matcher: "value"}[matcher] == "value"
+
+    # Unhashable validators fall back to identity
+    validator = [1, 2]
+    unhashable_matcher = AnyValue(int, validator)
+    assert hash(unhashable_matcher) == hash(unhashable_matcher)
+
+    # Matchers don't hash like the values they are equal to: they can't be used
+    # to look values up
+    assert 5 == AnyValue(int)
+    assert 5 not in {AnyValue(int)}
+    assert AnyValue(int) not in {5: "five"}
+
+
+def test_slots() -> None:
+    """Test that matchers don't carry a per-instance __dict__."""
+    matcher = AnyValue(int)
+    assert not hasattr(matcher, "__dict__")
+    assert weakref.ref(matcher)() is matcher
+
+    # Subscripted instantiation still works
+    assert 42 == AnyValue[type[int]](int)
+
+
+def test_annotated_types_not_imported() -> None:
+    """Test that importing and using anyvalue doesn't import annotated-types."""
+    code = (
+        "import sys; from anyvalue import AnyValue; "
+        "assert 42 == AnyValue(int, lambda x: x > 0); "
+        "assert 'annotated_types' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_jit_requires_numba(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that jit=True fails loudly when numba isn't installed."""
+    monkeypatch.setitem(sys.modules, "numba", None)
+    with pytest.raises(ImportError):
+        AnyValue(int, Predicate(lambda x: x % 2 == 0), jit=True)
+
+    # Matchers without predicates or callables don't need numba
+    assert 42 == AnyValue(int, Ge(0), jit=True)
+
+
+def test_jit() -> None:
+    """Test JIT-compiled predicates and callables."""
+    pytest.importorskip("numba")
+
+    def is_prime(n: int) -> bool:
+        if n < 2:
+            return False
+        i = 2
+        while i * i <= n:
+            if n % i == 0:
+                return False
+            i += 1
+        return True
+
+    matcher = AnyValue(int, Ge(0), is_prime, jit=True)
+    assert 7 == matcher
+    assert 10 != matcher
+    assert -7 != matcher
+
+    # Values Numba can't convert to a compiled signature are checked with the
+    # plain function
+    def is_positive_square(x: int) -> bool:
+        return x * x > 0
+
+    square_matcher = AnyValue(int, is_positive_square, jit=True)
+    assert 3 == square_matcher
+    assert 2**70 == square_matcher
+    assert 3 == square_matcher
+
+    # Predicates Numba can't compile fall back to the plain function
+    starts_with_hello = Predicate(lambda x: x.startswith("hello"))
+    assert "hello world" == AnyValue(str, starts_with_hello, jit=True)
+    assert "goodbye" != AnyValue(str, starts_with_hello, jit=True)
+
+    # So do validators that aren't plain Python functions
+    assert 42 == AnyValue(int, functools.partial(operator.lt, 0), jit=True)
+    assert "HELLO" == AnyValue(str, Predicate(str.isupper), jit=True)
+    assert -1 == AnyValue(int, Predicate(abs), jit=True)
+
+
+def test_memoize_predicates() -> None:
+    """Test memoized predicates and callables."""
+    calls: list[object] = []
+
+    def is_positive(value: int) -> bool:
+        calls.append(value)
+        return value > 0
+
+    assert 10**20 == AnyValue(int, is_positive, memoize_predicates=True)
+    assert 10**20 == AnyValue(int, is_positive, memoize_predicates=True)
+    assert -(10**20) != AnyValue(int, is_positive, memoize_predicates=True)
+    assert calls == [10**20, -(10**20)]
+
+    # Equal values of different types aren't mixed up
+    assert 1.0 == AnyValue(int | float, is_positive, memoize_predicates=True)
+    assert calls == [10**20, -(10**20), 1.0]
+
+    # Unhashable values are passed through
+    def is_not_empty(value: list[int]) -> bool:
+        calls.append(value)
+        return len(value) > 0
+
+    assert [1] == AnyValue(list, is_not_empty, memoize_predicates=True)
+    assert [] != AnyValue(list, is_not_empty, memoize_predicates=True)
+    assert calls[-2:] == [[1], []]
+
+
+@pytest.mark.parametrize(
+    "matcher",
+    [
+        pytest.param(AnyValue(int), id="type_only"),
+        pytest.param(AnyValue(int | None, Ge(0)), id="generated"),
+        pytest.param(
+            AnyValue(int, Predicate(lambda x: x > 0), memoize_predicates=True),
+            id="cached",
+        ),
+        pytest.param(AnyValue(int, Gt(0), Ge(1), Lt(9), Le(8), Gt(2)), id="generic"),
+    ],
+)
+def test_comparison_returns_bool(matcher: AnyValue[typing.Any]) -> None:
+    """Test that comparisons return the bool singletons, never NotImplemented."""
+    assert matcher.__eq__(5) is True
+    assert matcher.__ne__(5) is False
+    assert matcher.__eq__("hello") is False
+    assert matcher.__ne__("hello") is True
+    assert matcher.__eq__(object()) is False
+    assert matcher.__eq__(matcher) is False
+
+
+def test_match_many() -> None:
+    """Test checking many values at once."""
+    assert AnyValue(int).match_many([]) == []
+    assert AnyValue(int, Ge(0)).match_many([1, -1, "a", None]) == [
+        True,
+        False,
+        False,
+        False,
+    ]
+    assert AnyValue(int | None, Ge(0)).match_many(range(-1, 2)) == [False, True, True]
+
+    # Generic path
+    matcher = AnyValue(int, Gt(0), Ge(1), Lt(9), Le(8), MultipleOf(2))
+    assert matcher.match_many(range(10)) == [i in (2, 4, 6, 8) for i in range(10)]
+
+    # The failure reason isn't recorded
+    assert repr(matcher) == (
+        "AnyValue(int, Gt(gt=0), Ge(ge=1), Lt(lt=9), Le(le=8), "
+        "MultipleOf(multiple_of=2))"
+    )
+
+
+@pytest.mark.parametrize(
+    "type_constraint,expected",
+    [
+        pytest.param(int, (int,), id="class"),
+        pytest.param(datetime, (datetime,), id="c_class"),
+        pytest.param(None, (None,), id="none"),
+        pytest.param(type(None), (None,), id="none_type"),
+        pytest.param(int | None, (int, None), id="union"),
+        pytest.param(typing.Optional[str], (str, None), id="optional"),  # noqa: UP045
+        pytest.param(list[int], (list[int],), id="generic_alias"),
+    ],
+)
+def test_parse_type_constraint(
+    type_constraint: typing.Any, expected: tuple[typing.Any, ...]
+) -> None:
+    """Test the normalization of type constraints."""
+    assert AnyValue._parse_type_constraint(type_constraint) == expected